@@ -1,5 +1,8 @@
 import numpy as np
 
+# Wall bit for each direction, used when tabulating passability per cell
+_DIR_BIT = {'u': 1, 'r': 2, 'd': 4, 'l': 8}
+
 class Maze:
     """
     A class representing a maze.
@@ -32,13 +35,16 @@ class Maze:
             # First line should be an integer with the maze dimensions
             self.dim = int(f_in.readline().strip())
 
-            # Read subsequent lines to describe the permeability of walls
-            walls = [list(map(int, line.strip().split(','))) for line in f_in]
-            self.walls = np.array(walls)
+            # Read subsequent lines to describe the permeability of walls,
+            # parsing directly into the uint8 array with NumPy's text reader
+            self.walls = np.loadtxt(f_in, dtype=np.uint8, delimiter=',')
 
         # Validate the maze's dimensions and wall permeability
         self._validate_maze()
 
+        # Precompute wall distances so sensor queries are O(1) lookups
+        self._build_distance_tables()
+
     def _validate_maze(self):
         """
         Validate the dimensions and wall permeability of the maze.
@@ -54,31 +60,83 @@ class Maze:
         if self.walls.shape != (self.dim, self.dim):
             raise Exception('Maze shape does not match dimension attribute!')
 
-        wall_errors = []
-        # Check vertical walls consistency
-        for x in range(self.dim - 1):
-            for y in range(self.dim):
-                # Check if the right edge of the current cell matches the left edge of the next cell
-                if (self.walls[x, y] & 2 != 0) != (self.walls[x + 1, y] & 8 != 0):
-                    wall_errors.append([(x, y), 'v'])
-
-        # Check horizontal walls consistency
-        for y in range(self.dim - 1):
-            for x in range(self.dim):
-                # Check if the top edge of the current cell matches the bottom edge of the next cell
-                if (self.walls[x, y] & 1 != 0) != (self.walls[x, y + 1] & 4 != 0):
-                    wall_errors.append([(x, y), 'h'])
-
-        # Report inconsistencies found
-        if wall_errors:
-            for cell, wall_type in wall_errors:
-                if wall_type == 'v':
-                    cell2 = (cell[0] + 1, cell[1])
-                    print(f'Inconsistent vertical wall between {cell} and {cell2}')
-                else:
-                    cell2 = (cell[0], cell[1] + 1)
-                    print(f'Inconsistent horizontal wall between {cell} and {cell2}')
-            raise Exception('Consistency errors found in wall specifications!')
+        # Check wall consistency with whole-array comparisons: the right edge
+        # of each cell must match the left edge of its neighbour, and the top
+        # edge must match the bottom edge of the cell above.
+        v_mismatch = ((self.walls[:-1, :] & 2) != 0) != ((self.walls[1:, :] & 8) != 0)
+        h_mismatch = ((self.walls[:, :-1] & 1) != 0) != ((self.walls[:, 1:] & 4) != 0)
+
+        # Valid mazes take the early return without building or allocating
+        # anything for error reporting
+        if not (v_mismatch.any() or h_mismatch.any()):
+            return
+
+        # Report the inconsistencies, recovering coordinates only on this
+        # rare error path
+        for x, y in np.argwhere(v_mismatch).tolist():
+            print(f'Inconsistent vertical wall between {(x, y)} and {(x + 1, y)}')
+        for x, y in np.argwhere(h_mismatch).tolist():
+            print(f'Inconsistent horizontal wall between {(x, y)} and {(x, y + 1)}')
+        raise Exception('Consistency errors found in wall specifications!')
+
+    def _build_distance_tables(self):
+        """
+        Precompute, for every cell and direction, the number of open cells
+        until the nearest wall.
+
+        Each table is filled with a single cumulative pass that sweeps away
+        from the relevant edge: a cell's distance is one more than its
+        neighbour's whenever the wall between them is open, and zero
+        otherwise. This turns dist_to_wall into a constant-time array read.
+
+        The tables are also combined into a sensor snapshot: sensors[x, y, h]
+        holds the (left, front, right) readings for a robot at (x, y) with
+        heading index h (0=up, 1=right, 2=down, 3=left), so a full sensor
+        sweep is one indexed read per step.
+        """
+        dim = self.dim
+        dist_r = np.zeros((dim, dim), dtype=np.int16)
+        dist_l = np.zeros((dim, dim), dtype=np.int16)
+
+        # The up/down sweeps run over x for a fixed y, which strides across
+        # rows of the C-ordered walls array; build them on transposed views
+        # so every pass reads and writes contiguous memory, then restore the
+        # [x, y] layout for lookups
+        walls_t = self.walls.T
+        dist_u_t = np.zeros((dim, dim), dtype=np.int16)
+        dist_d_t = np.zeros((dim, dim), dtype=np.int16)
+
+        for y in range(dim - 2, -1, -1):
+            dist_u_t[y] = np.where(walls_t[y] & 1, dist_u_t[y + 1] + 1, 0)
+        for y in range(1, dim):
+            dist_d_t[y] = np.where(walls_t[y] & 4, dist_d_t[y - 1] + 1, 0)
+        for x in range(dim - 2, -1, -1):
+            dist_r[x] = np.where(self.walls[x] & 2, dist_r[x + 1] + 1, 0)
+        for x in range(1, dim):
+            dist_l[x] = np.where(self.walls[x] & 8, dist_l[x - 1] + 1, 0)
+
+        dist_u = np.ascontiguousarray(dist_u_t.T)
+        dist_d = np.ascontiguousarray(dist_d_t.T)
+
+        self._dist = {'u': dist_u, 'r': dist_r, 'd': dist_d, 'l': dist_l,
+                      'up': dist_u, 'right': dist_r, 'down': dist_d, 'left': dist_l}
+
+        # C order keeps the readings axis innermost, so sensors[x, y, h] is
+        # a contiguous three-element row
+        stacked = np.stack([dist_u, dist_r, dist_d, dist_l])
+        self.sensors = np.empty((dim, dim, 4, 3), dtype=np.int16)
+        for h in range(4):
+            self.sensors[:, :, h, 0] = stacked[(h + 3) & 3]  # left of heading
+            self.sensors[:, :, h, 1] = stacked[h]            # straight ahead
+            self.sensors[:, :, h, 2] = stacked[(h + 1) & 3]  # right of heading
+
+        # Tabulate passability per cell and direction as boolean arrays;
+        # the walls never change after construction, so is_permissible can
+        # be a plain indexed read
+        open_u, open_r, open_d, open_l = ((self.walls & _DIR_BIT[d]) != 0
+                                          for d in ('u', 'r', 'd', 'l'))
+        self._open = {'u': open_u, 'r': open_r, 'd': open_d, 'l': open_l,
+                      'up': open_u, 'right': open_r, 'down': open_d, 'left': open_l}
 
     def is_permissible(self, cell, direction):
         """
@@ -96,9 +154,8 @@ class Maze:
         bool
             True if the cell is passable in the given direction, otherwise False.
         """
-        dir_int = {'u': 1, 'r': 2, 'd': 4, 'l': 8, 'up': 1, 'right': 2, 'down': 4, 'left': 8}
         try:
-            return bool(self.walls[tuple(cell)] & dir_int[direction])
+            return bool(self._open[direction][cell[0], cell[1]])
         except KeyError:
             print('Invalid direction provided!')
             return False
@@ -119,15 +176,8 @@ class Maze:
         int
             The number of open cells until the nearest wall.
         """
-        dir_move = {'u': [0, 1], 'r': [1, 0], 'd': [0, -1], 'l': [-1, 0],
-                    'up': [0, 1], 'right': [1, 0], 'down': [0, -1], 'left': [-1, 0]}
-        
-        distance = 0
-        current_cell = list(cell)  # Create a copy of the cell to avoid modifying the original
-
-        while self.is_permissible(current_cell, direction):
-            distance += 1
-            current_cell[0] += dir_move[direction][0]
-            current_cell[1] += dir_move[direction][1]
-
-        return distance
+        try:
+            return int(self._dist[direction][cell[0], cell[1]])
+        except KeyError:
+            print('Invalid direction provided!')
+            return 0
@@ -1,3 +1,12 @@
+import numpy as np
+
+# Heading bookkeeping tables: headings are stored internally as an integer
+# index 0..3 so rotations reduce to masked addition, with the name table kept
+# for any external consumer. _DX/_DY give the movement offset per heading.
+_HEADING_NAMES = ('up', 'right', 'down', 'left')
+_DX = (0, 1, 0, -1)
+_DY = (1, 0, -1, 0)
+
 class Robot(object):
     def __init__(self, maze_dim):
         """
@@ -9,11 +18,18 @@ class Robot(object):
             Dimension of the square maze (width and height).
         """
         self.maze_dim = maze_dim
-        self.heading = 'up'
-        self.location = [0, 0]
-        self.visited = set()  # Keep track of visited cells
-        self.visited.add(tuple(self.location))  # Add starting position to visited
-        self.goal_bounds = [self.maze_dim // 2 - 1, self.maze_dim // 2]  # Center goal area
+        self.heading_idx = 0  # Index into _HEADING_NAMES; 0 is 'up'
+        self.x = 0
+        self.y = 0
+        # Keep track of visited cells as a bitmap: one byte per cell instead
+        # of a hashed tuple per entry
+        self.visited = np.zeros((maze_dim, maze_dim), dtype=np.uint8)
+        self.visited[0, 0] = 1  # Mark starting position as visited
+        # Boolean mask of the 2x2 center goal area, so the per-step goal
+        # check is a single array lookup
+        self._goal_mask = np.zeros((maze_dim, maze_dim), dtype=bool)
+        self._goal_mask[maze_dim // 2 - 1:maze_dim // 2 + 1,
+                        maze_dim // 2 - 1:maze_dim // 2 + 1] = True
 
     def next_move(self, sensors):
         """
@@ -66,25 +82,22 @@ class Robot(object):
             The movement (in cells) of the robot.
         """
         # Update the heading based on rotation
-        self.heading = self.get_new_heading(rotation)
+        self.heading_idx = self.get_new_heading(rotation)
 
         # Move the robot forward based on the updated heading
-        if movement > 0:
-            if self.heading == 'up':
-                self.location[1] += 1
-            elif self.heading == 'right':
-                self.location[0] += 1
-            elif self.heading == 'down':
-                self.location[1] -= 1
-            elif self.heading == 'left':
-                self.location[0] -= 1
-
-        # Mark the new location as visited
-        self.visited.add(tuple(self.location))
+        self.x += _DX[self.heading_idx] * movement
+        self.y += _DY[self.heading_idx] * movement
+
+        # Mark the new location as visited. The position is dead-reckoned
+        # from the robot's own moves without wall feedback, so it can drift
+        # off-grid; only in-bounds cells are recorded, as with the old set.
+        if 0 <= self.x < self.maze_dim and 0 <= self.y < self.maze_dim:
+            self.visited[self.x, self.y] = 1
 
     def get_new_heading(self, rotation):
         """
-        Get the new heading of the robot based on the current heading and rotation.
+        Get the new heading index of the robot based on the current heading
+        and rotation.
 
         Parameters:
         -----------
@@ -93,14 +106,20 @@ class Robot(object):
 
         Returns:
         --------
-        str
-            The updated heading direction.
+        int
+            The updated heading index (0..3 into _HEADING_NAMES).
         """
-        headings = ['up', 'right', 'down', 'left']
-        current_index = headings.index(self.heading)
-        rotation_steps = rotation // 90
-        new_index = (current_index + rotation_steps) % 4
-        return headings[new_index]
+        return (self.heading_idx + rotation // 90) & 3
+
+    @property
+    def heading(self):
+        """The robot's current heading as a direction name."""
+        return _HEADING_NAMES[self.heading_idx]
+
+    @property
+    def location(self):
+        """The robot's current location as an (x, y) tuple."""
+        return (self.x, self.y)
 
     def is_at_goal(self):
         """
@@ -111,5 +130,9 @@ class Robot(object):
         bool
             True if the robot is at the goal area, False otherwise.
         """
-        return (self.location[0] in self.goal_bounds and
-                self.location[1] in self.goal_bounds)
\ No newline at end of file
+        # The dead-reckoned position can drift off-grid (see
+        # update_position); off-grid is never the goal, and indexing the
+        # mask there would raise or wrap around to a wrong cell.
+        if not (0 <= self.x < self.maze_dim and 0 <= self.y < self.maze_dim):
+            return False
+        return bool(self._goal_mask[self.x, self.y])
\ No newline at end of file
@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import LineCollection
 from maze import Maze
+import numpy as np
 import sys
 
 def plot_maze(maze_filename):
@@ -19,11 +19,9 @@ def plot_maze(maze_filename):
     # Load the maze data
     maze = Maze(maze_filename)
 
-    # Extract walls and create rectangular patches for each wall
-    wall_patches = extract_walls(maze)
-
-    # Add wall patches to the plot
-    ax.add_collection(PatchCollection(wall_patches, match_original=True))
+    # Extract the wall segments and draw them all in a single collection
+    segments = extract_walls(maze)
+    ax.add_collection(LineCollection(segments, colors='k', linewidths=2))
 
     # Set plot properties
     set_plot_properties(ax, maze.dim)
@@ -31,9 +29,18 @@ def plot_maze(maze_filename):
     # Display the plot
     plt.show()
 
+# Per-direction wall geometry: the wall bit and the segment endpoint offsets
+# relative to the cell's lower-left corner
+_WALL_SEGMENTS = (
+    (1, (0, 1), (1, 1)),  # up
+    (2, (1, 0), (1, 1)),  # right
+    (4, (0, 0), (1, 0)),  # down
+    (8, (0, 0), (0, 1)),  # left
+)
+
 def extract_walls(maze):
     """
-    Identify and create wall patches based on the maze's structure.
+    Identify the maze's walls as line segments.
 
     Parameters:
     -----------
@@ -42,23 +49,18 @@ def extract_walls(maze):
 
     Returns:
     --------
-    list
-        A list of Matplotlib patch objects representing walls.
+    numpy.ndarray
+        An (N, 2, 2) array of segment endpoints, one row per wall.
     """
-    walls = []
+    segments = []
 
-    for x in range(maze.dim):
-        for y in range(maze.dim):
-            if not maze.is_permissible([x, y], 'up'):
-                walls.append(patches.Rectangle((x, y + 1), 1, 0.1, edgecolor='none'))
-            if not maze.is_permissible([x, y], 'right'):
-                walls.append(patches.Rectangle((x + 1, y), 0.1, 1, edgecolor='none'))
-            if not maze.is_permissible([x, y], 'down'):
-                walls.append(patches.Rectangle((x, y), 1, 0.1, edgecolor='none'))
-            if not maze.is_permissible([x, y], 'left'):
-                walls.append(patches.Rectangle((x, y), 0.1, 1, edgecolor='none'))
+    # Find every blocked edge with a whole-array mask computation per
+    # direction, then offset the cell corners to the segment endpoints
+    for bit, start, end in _WALL_SEGMENTS:
+        cells = np.argwhere((maze.walls & bit) == 0)
+        segments.append(np.stack([cells + start, cells + end], axis=1))
 
-    return walls
+    return np.concatenate(segments)
 
 def set_plot_properties(ax, maze_dim):
     """
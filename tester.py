@@ -1,39 +1,155 @@
 from maze import Maze
 from robot import Robot
+import logging
+import numpy as np
 import sys
 
-# Global dictionaries for robot movement and sensing
-DIRECTION_SENSORS = {
-    'u': ['l', 'u', 'r'], 'r': ['u', 'r', 'd'],
-    'd': ['r', 'd', 'l'], 'l': ['d', 'l', 'u'],
-    'up': ['l', 'u', 'r'], 'right': ['u', 'r', 'd'],
-    'down': ['r', 'd', 'l'], 'left': ['d', 'l', 'u']
-}
-DIRECTION_MOVE = {
-    'u': [0, 1], 'r': [1, 0], 'd': [0, -1], 'l': [-1, 0],
-    'up': [0, 1], 'right': [1, 0], 'down': [0, -1], 'left': [-1, 0]
-}
-DIRECTION_REVERSE = {
-    'u': 'd', 'r': 'l', 'd': 'u', 'l': 'r',
-    'up': 'd', 'right': 'l', 'down': 'u', 'left': 'r'
-}
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Numba is optional; the interpreted loop is used without it
+
+# Headings are integers 0..3 (0=up, 1=right, 2=down, 3=left) everywhere on
+# the simulation path; the name table exists only for the I/O boundary. The
+# movement offsets and reverse headings are arrays indexed by that integer,
+# so no string hashing happens per step.
+_HEADINGS = ('up', 'right', 'down', 'left')
+_MOVE_DX = np.array([0, 1, 0, -1], dtype=np.int8)
+_MOVE_DY = np.array([1, 0, -1, 0], dtype=np.int8)
+_REVERSE = np.array([2, 3, 0, 1], dtype=np.int8)
+
+# Precomputed (heading, rotation) -> new heading table so perform_rotation
+# is a single dict fetch
+_ROT_TO_STEP = {-90: -1, 0: 0, 90: 1}
+_NEW_HEADING = {(h, r): (h + s) & 3
+                for h in range(4)
+                for r, s in _ROT_TO_STEP.items()}
 
 # Test and score parameters
 MAX_TIME = 1000
 TRAIN_SCORE_MULTIPLIER = 1 / 30.0
 
-def run_simulation(maze_filename):
+logger = logging.getLogger(__name__)
+
+def _simulate_run(dist, goal_low, goal_high, max_time, stop_at_goal):
+    """
+    Step the robot through one run using only integer arithmetic and the
+    stacked wall-distance tables, mirroring the interpreted loop below with
+    Robot.next_move's sensor branches inlined.
+
+    Parameters:
+    -----------
+    dist : numpy.ndarray
+        Wall distances of shape (4, dim, dim), indexed by heading
+        (0=up, 1=right, 2=down, 3=left) and cell coordinates.
+    goal_low, goal_high : int
+        Inclusive coordinate bounds of the center goal area.
+    max_time : int
+        Maximum number of steps before the run is abandoned.
+    stop_at_goal : bool
+        Whether reaching the goal ends the run (second run only).
+
+    Returns:
+    --------
+    tuple of (total_time, goal_reached)
+        Steps taken and whether the goal area was entered.
+    """
+    x, y, heading = 0, 0, 0
+    total_time = 0
+    goal_reached = False
+
+    while True:
+        total_time += 1
+        if total_time > max_time:
+            return total_time, goal_reached
+
+        # Sensor readings: distances to the left, front and right of the robot
+        left = dist[(heading + 3) & 3, x, y]
+        front = dist[heading, x, y]
+        right = dist[(heading + 1) & 3, x, y]
+
+        # Robot.next_move decision logic: prefer forward, then left, then
+        # right; turn in place when boxed in
+        if front > 0:
+            rotation_steps, movement = 0, 1
+        elif left > 0:
+            rotation_steps, movement = -1, 1
+        elif right > 0:
+            rotation_steps, movement = 1, 1
+        else:
+            rotation_steps, movement = 1, 0
+
+        # Rotate, then move clamped against the wall distance
+        heading = (heading + rotation_steps) & 3
+        steps = min(movement, int(dist[heading, x, y]))
+        x += ((heading == 1) - (heading == 3)) * steps
+        y += ((heading == 0) - (heading == 2)) * steps
+
+        if goal_low <= x <= goal_high and goal_low <= y <= goal_high:
+            goal_reached = True
+            if stop_at_goal:
+                return total_time, True
+
+if njit is not None:
+    _simulate_run = njit(cache=True)(_simulate_run)
+
+def _run_simulation_jit(maze):
+    """
+    Run both simulation runs through the compiled stepping kernel.
+
+    Parameters:
+    -----------
+    maze : Maze
+        The Maze object to navigate.
+    """
+    dist = np.stack([maze._dist['u'], maze._dist['r'],
+                     maze._dist['d'], maze._dist['l']])
+    runtimes = []
+
+    for run_number in range(2):
+        print(f"\nStarting run {run_number + 1}...")
+        total_time, goal_reached = _simulate_run(
+            dist, maze.dim // 2 - 1, maze.dim // 2, MAX_TIME,
+            run_number == 1)
+
+        if total_time > MAX_TIME:
+            print("Time limit exceeded.")
+        elif goal_reached:
+            runtimes.append(total_time - sum(runtimes))
+            print(f"Goal reached! Run {run_number + 1} complete.")
+
+    # Calculate and report the final score
+    if len(runtimes) == 2:
+        final_score = runtimes[1] + TRAIN_SCORE_MULTIPLIER * runtimes[0]
+        print(f"Task complete! Score: {final_score:.3f}")
+
+def run_simulation(maze_filename, use_jit=True, verbose=False):
     """
     Run the robot simulation on the specified maze file.
-    
+
     Parameters:
     -----------
     maze_filename : str
         The filename of the text file containing the maze data.
+    use_jit : bool
+        Whether to use the compiled stepping kernel when Numba is
+        available; the interpreted loop below is kept as the fallback.
+    verbose : bool
+        Whether to log the robot's position, sensor readings and decision
+        on every step. Off by default so the hot loop does no string
+        formatting or I/O; enabling it runs the interpreted loop, since
+        the compiled kernel produces no per-step output.
     """
+    if verbose:
+        logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     # Create a maze based on the input file
     maze = Maze(maze_filename)
 
+    if use_jit and njit is not None and not verbose:
+        _run_simulation_jit(maze)
+        return
+
     # Initialize the robot and set up its starting position
     robot = Robot(maze.dim)
     runtimes = []
@@ -42,7 +158,8 @@ def run_simulation(maze_filename):
         print(f"\nStarting run {run_number + 1}...")
 
         # Initialize the robot's position and heading
-        robot_position = {'location': [0, 0], 'heading': 'up'}
+        x, y = 0, 0
+        heading = 0  # up
         total_time = 0
         run_active = True
         goal_reached = False
@@ -55,16 +172,20 @@ def run_simulation(maze_filename):
                 print("Time limit exceeded.")
                 break
 
-            # Get sensor readings for the current position and heading
-            sensor_readings = [maze.dist_to_wall(robot_position['location'], direction)
-                               for direction in DIRECTION_SENSORS[robot_position['heading']]]
+            # Get sensor readings for the current position and heading from
+            # the maze's precomputed snapshot
+            sensor_readings = maze.sensors[x, y, heading]
 
             # Get the robot's action (rotation and movement)
             rotation, movement = robot.next_move(sensor_readings)
 
-            # Debug information about the robot's decision
-            print(f"Position: {robot_position['location']}, Heading: {robot_position['heading']}")
-            print(f"Sensors: {sensor_readings}, Rotation: {rotation}, Movement: {movement}")
+            # Debug information about the robot's decision (deferred
+            # formatting, so the quiet path pays nothing for it)
+            if verbose:
+                logger.debug('Position: %s, Heading: %s, Sensors: %s, '
+                             'Rotation: %s, Movement: %s',
+                             (x, y), _HEADINGS[heading], sensor_readings,
+                             rotation, movement)
 
             # Handle reset conditions
             if (rotation, movement) == ('Reset', 'Reset'):
@@ -73,18 +194,21 @@ def run_simulation(maze_filename):
                     print("Ending first run. Starting the next run...")
                     break
                 else:
-                    print("Cannot reset before reaching the goal.")
+                    if verbose:
+                        logger.debug("Cannot reset before reaching the goal.")
                     continue
 
             # Perform rotation
-            robot_position['heading'] = perform_rotation(robot_position['heading'], rotation)
+            heading = perform_rotation(heading, rotation)
 
             # Perform movement
-            if not move_robot(maze, robot_position, movement):
-                print("Movement blocked by a wall.")
+            x, y, moved = move_robot(maze, x, y, heading, movement)
+            if not moved:
+                if verbose:
+                    logger.debug("Movement blocked by a wall.")
 
             # Check if the goal is reached
-            if is_goal_reached(robot_position['location'], maze.dim):
+            if is_goal_reached((x, y), maze):
                 goal_reached = True
                 if run_number == 1:
                     runtimes.append(total_time - sum(runtimes))
@@ -99,86 +223,85 @@ def run_simulation(maze_filename):
 def perform_rotation(current_heading, rotation):
     """
     Update the robot's heading based on the specified rotation.
-    
+
     Parameters:
     -----------
-    current_heading : str
-        The current direction the robot is facing.
+    current_heading : int
+        The heading index (0..3) the robot is facing.
     rotation : int
         The rotation angle (in degrees).
-    
+
     Returns:
     --------
-    str
-        The updated direction the robot is facing.
+    int
+        The updated heading index.
     """
-    if rotation == -90:
-        return DIRECTION_SENSORS[current_heading][0]
-    elif rotation == 90:
-        return DIRECTION_SENSORS[current_heading][2]
-    elif rotation == 0:
-        return current_heading
-    else:
+    try:
+        return _NEW_HEADING[current_heading, rotation]
+    except KeyError:
         print("Invalid rotation value. No rotation performed.")
         return current_heading
 
-def move_robot(maze, robot_position, movement):
+def move_robot(maze, x, y, heading, movement):
     """
     Move the robot in the specified direction.
-    
+
     Parameters:
     -----------
     maze : Maze
         The Maze object containing information about walls.
-    robot_position : dict
-        A dictionary containing the robot's current location and heading.
+    x, y : int
+        The robot's current coordinates.
+    heading : int
+        The heading index (0..3) the robot is facing.
     movement : int
         The number of squares to move (-3 to 3).
-    
+
     Returns:
     --------
-    bool
-        True if the robot moved successfully, False if it was blocked by a wall.
+    tuple of (x, y, moved)
+        The robot's new coordinates and whether the full move succeeded
+        without being blocked by a wall.
     """
     # Limit movement to a maximum of 3 squares per turn
     movement = max(min(int(movement), 3), -3)
-    
-    while movement:
-        if movement > 0:
-            if maze.is_permissible(robot_position['location'], robot_position['heading']):
-                robot_position['location'][0] += DIRECTION_MOVE[robot_position['heading']][0]
-                robot_position['location'][1] += DIRECTION_MOVE[robot_position['heading']][1]
-                movement -= 1
-            else:
-                return False
-        else:
-            reverse_heading = DIRECTION_REVERSE[robot_position['heading']]
-            if maze.is_permissible(robot_position['location'], reverse_heading):
-                robot_position['location'][0] += DIRECTION_MOVE[reverse_heading][0]
-                robot_position['location'][1] += DIRECTION_MOVE[reverse_heading][1]
-                movement += 1
-            else:
-                return False
-    return True
-
-def is_goal_reached(location, maze_dim):
+
+    if movement < 0:
+        heading = int(_REVERSE[heading])
+        movement = -movement
+
+    # Clamp the stride against the precomputed forward wall distance and
+    # update the location in one step; the robot stops at the wall if it is
+    # too close
+    steps = min(movement, int(maze.sensors[x, y, heading, 1]))
+    x += int(_MOVE_DX[heading]) * steps
+    y += int(_MOVE_DY[heading]) * steps
+    return x, y, steps == movement
+
+def is_goal_reached(location, maze):
     """
     Check if the robot has reached the goal (center of the maze).
-    
+
     Parameters:
     -----------
     location : list of int
         The robot's current location [x, y].
-    maze_dim : int
-        The dimension of the maze (width and height).
-    
+    maze : Maze
+        The Maze object being navigated.
+
     Returns:
     --------
     bool
         True if the robot has reached the goal, False otherwise.
     """
-    goal_range = [maze_dim // 2 - 1, maze_dim // 2]
-    return location[0] in goal_range and location[1] in goal_range
+    goal_mask = getattr(maze, '_goal_mask', None)
+    if goal_mask is None:
+        # Build the 2x2 center goal mask once and cache it on the maze
+        goal_mask = np.zeros((maze.dim, maze.dim), dtype=bool)
+        goal_mask[maze.dim // 2 - 1:maze.dim // 2 + 1,
+                  maze.dim // 2 - 1:maze.dim // 2 + 1] = True
+        maze._goal_mask = goal_mask
+    return bool(goal_mask[location[0], location[1]])
 
 if __name__ == "__main__":
     if len(sys.argv) < 2: